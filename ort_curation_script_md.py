@@ -1,80 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import httpx
+import itertools
 import yaml
 import json
 import os
-from openai import AzureOpenAI
+import pickle
+import random
+import time
+from collections import Counter
+import openai
+from openai import AsyncAzureOpenAI
 from datetime import datetime
-from typing import Dict, List, Any
-
-class ORTCurationReportGenerator:
-    def __init__(self, azure_config: Dict[str, str]):
-        """Initialize the Azure OpenAI client."""
-        self.client = AzureOpenAI(
-            api_version=azure_config['api_version'],
-            azure_endpoint=azure_config['endpoint'],
-            api_key=azure_config['api_key']
-        )
-        self.deployment_name = azure_config['deployment_name']
-    
-    def load_ort_results(self, file_path: str) -> Dict[str, Any]:
-        """Load the ORT analyzer results from YAML file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    
-    def extract_key_info(self, ort_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract key information from ORT results."""
-        analyzer = ort_data.get('analyzer', {})
-        result = analyzer.get('result', {})
-        repository = ort_data.get('repository', {})
-        
-        return {
-            'repository_url': repository.get('vcs_processed', {}).get('url', 'N/A'),
-            'revision': repository.get('vcs_processed', {}).get('revision', 'N/A'),
-            'ort_version': analyzer.get('environment', {}).get('ort_version', 'N/A'),
-            'scan_time': {
-                'start': analyzer.get('start_time', 'N/A'),
-                'end': analyzer.get('end_time', 'N/A')
+from typing import Any
+
+try:
+    # LibYAML's C parser is roughly an order of magnitude faster than the
+    # pure-Python SafeLoader on large analyzer-result.yml files.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # orjson decodes/encodes several times faster than the stdlib json
+    import orjson
+
+    def _json_loads(buf):
+        return orjson.loads(buf)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(buf):
+        return json.loads(buf)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, default=str).encode('utf-8')
+
+# Minimal shape of an ORT analyzer result; enough to reject files that
+# would otherwise .get() their way into a junk prompt and a wasted LLM call.
+_ORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "analyzer": {
+            "type": "object",
+            "properties": {
+                "result": {
+                    "type": "object",
+                    "properties": {
+                        "packages": {"type": "array"},
+                        "issues": {"type": "object"}
+                    }
+                }
             },
-            'projects': result.get('projects', []),
-            'packages': result.get('packages', []),
-            'issues': result.get('issues', {}),
-            'package_managers': analyzer.get('config', {}).get('enabled_package_managers', [])
+            "required": ["result"]
+        },
+        "repository": {
+            "type": "object",
+            "properties": {
+                "vcs_processed": {"type": "object"}
+            }
         }
-    
-    def determine_analysis_status(self, ort_data: Dict[str, Any]) -> str:
-        """Determine if the analysis was successful or had errors."""
-        issues = ort_data.get('analyzer', {}).get('result', {}).get('issues', {})
-        packages = ort_data.get('analyzer', {}).get('result', {}).get('packages', [])
-        
-        if issues and len(issues) > 0:
-            return "ERROR"
-        elif packages and len(packages) > 0:
-            return "SUCCESS"
-        else:
-            return "INCOMPLETE"
-    
-    def generate_curation_prompt(self, key_info: Dict[str, Any], status: str) -> str:
-        """Generate a comprehensive prompt for the LLM."""
-        prompt = f"""You are an expert software compliance analyst reviewing ORT (OSS Review Toolkit) analysis results.
+    },
+    "required": ["analyzer"]
+}
+
+try:
+    import fastjsonschema
+
+    # Compiled once at import; the generated validator runs in sub-ms and
+    # raises JsonSchemaException (a ValueError subclass) on bad input.
+    _validate_ort = fastjsonschema.compile(_ORT_SCHEMA)
+except ImportError:
+    def _validate_ort(data):
+        if (not isinstance(data, dict)
+                or not isinstance(data.get('analyzer'), dict)
+                or not isinstance(data['analyzer'].get('result'), dict)):
+            raise ValueError("data must contain an analyzer.result mapping")
+        return data
+
+# Parsed-YAML cache keyed on (mtime_ns, size) so repeated invocations on an
+# unchanged analyzer-result.yml skip the parse entirely.
+_yaml_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_version: str, endpoint: str, api_key: str) -> AsyncAzureOpenAI:
+    """Build (or reuse) the AsyncAzureOpenAI client for a configuration.
+
+    Each client owns an httpx connection pool and TLS context (~200ms to
+    construct); caching keeps connections warm and HTTP keep-alive
+    effective when the module is imported as a library and the generator
+    is constructed repeatedly.
+    """
+    return AsyncAzureOpenAI(
+        api_version=api_version,
+        azure_endpoint=endpoint,
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    )
+
+# Static prompt scaffolding, hoisted to module level so the multi-KB
+# literals are built once at import instead of on every call.
+_PROMPT_HEADER = """You are an expert software compliance analyst reviewing ORT (OSS Review Toolkit) analysis results.
 
 **Analysis Status**: {status}
 
 **Repository Information**:
-- Repository: {key_info['repository_url']}
-- Revision: {key_info['revision']}
-- ORT Version: {key_info['ort_version']}
+- Repository: {repository_url}
+- Revision: {revision}
+- ORT Version: {ort_version}
 
 **Scan Details**:
-- Start Time: {key_info['scan_time']['start']}
-- End Time: {key_info['scan_time']['end']}
+- Start Time: {scan_start}
+- End Time: {scan_end}
 
-**Projects Analyzed**: {len(key_info['projects'])}
-**Packages Detected**: {len(key_info['packages'])}
-**Issues Found**: {len(key_info['issues'])}
+**Projects Analyzed**: {num_projects}
+**Packages Detected**: {num_packages}
+**Issues Found**: {num_issues}
 
 """
-        
-        if status == "SUCCESS":
-            prompt += """
+
+_SUCCESS_TEMPLATE = """
 **Your Task**: Generate a comprehensive curation report in PROPER MARKDOWN FORMAT.
 
 CRITICAL FORMATTING RULES:
@@ -106,10 +158,7 @@ CRITICAL FORMATTING RULES:
 ## Package Inventory
 
 ### Package Summary
-[Provide statistics]
-
-### Detailed Package List
-[Create a well-formatted table or list with: Package Name, Version, License, Source]
+[Provide statistics based on the package and project counts above]
 
 ## Risk Assessment
 
@@ -148,18 +197,16 @@ Example format:
 
 ## Appendix
 
-### Package Details
-[Additional technical information]
+### License Details
+[Additional notes on the licenses listed in the distribution below]
 
-**Package Information**:
+Base the report strictly on the data provided; do not invent package
+names, versions, or sources that are not listed.
+
+**Declared License Distribution** (license set -> package count):
 """
-            for pkg in key_info['packages'][:10]:  # Limit to first 10 for prompt size
-                prompt += f"\n- {pkg.get('id', 'Unknown')}"
-                prompt += f"\n  License: {pkg.get('declared_licenses', ['Unknown'])}"
-                prompt += f"\n  Homepage: {pkg.get('homepage_url', 'N/A')}"
-                
-        else:  # ERROR case
-            prompt += """
+
+_ERROR_TEMPLATE = """
 **Your Task**: Generate an error analysis report in PROPER MARKDOWN FORMAT.
 
 CRITICAL FORMATTING RULES:
@@ -235,51 +282,484 @@ CRITICAL FORMATTING RULES:
 
 **Error Details**:
 """
-            for project_id, issues in key_info['issues'].items():
-                prompt += f"\n\nProject: {project_id}"
-                for issue in issues:
-                    prompt += f"\n- Severity: {issue.get('severity', 'Unknown')}"
-                    prompt += f"\n- Source: {issue.get('source', 'Unknown')}"
-                    prompt += f"\n- Message: {issue.get('message', 'Unknown')[:500]}..."
-        
-        prompt += "\n\nREMEMBER: Strictly follow proper markdown formatting with blank lines, proper heading hierarchy, and consistent indentation. The output must be valid, well-formatted markdown."
-        return prompt
+
+_PROMPT_FOOTER = "\n\nREMEMBER: Strictly follow proper markdown formatting with blank lines, proper heading hierarchy, and consistent indentation. The output must be valid, well-formatted markdown."
+
+class ORTCurationReportGenerator:
+    SYSTEM_PROMPT = "You are an expert software compliance analyst specializing in open-source license compliance and dependency analysis. You always produce well-formatted, valid markdown with proper heading hierarchy, blank lines, and consistent formatting."
+
+    # Disk cache for LLM responses; with temperature=0 identical prompts
+    # produce identical reports, so repeat runs skip the API entirely.
+    RESPONSE_CACHE_DIR = os.path.expanduser('~/.cache/ort-curation')
+
+    METADATA_TEMPLATE = """# ORT Analysis Curation Report
+
+**Generated:** {generated}  
+**Status:** {status}  
+**Repository:** {repository_url}  
+**Revision:** {revision}...
+
+---
+
+"""
+
+    def __init__(self, azure_config: dict[str, str]):
+        """Initialize the Azure OpenAI client."""
+        self.client = _get_client(
+            azure_config['api_version'],
+            azure_config['endpoint'],
+            azure_config['api_key']
+        )
+        self.deployment_name = azure_config['deployment_name']
     
-    def generate_report(self, file_path: str) -> str:
-        """Generate the curation report using Azure OpenAI."""
-        # Load and parse ORT results
+    def load_ort_results(self, file_path: str) -> dict[str, Any]:
+        """Load the ORT analyzer results from YAML file.
+
+        Results are cached in memory and on disk (a sibling .pickle file)
+        keyed on the source file's mtime and size, so reruns on an
+        unchanged file skip the YAML parse.
+        """
+        st = os.stat(file_path)
+        cache_key = (st.st_mtime_ns, st.st_size)
+
+        cached = _yaml_cache.get(file_path)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        # Disk cache: unpickling is 20-50x faster than reparsing the YAML.
+        # Fixed filename with the freshness key stored in the payload, so
+        # regenerated inputs overwrite the old generation instead of
+        # accumulating one pickle per mtime.
+        pickle_path = f"{file_path}.pickle"
+        if os.path.exists(pickle_path):
+            try:
+                with open(pickle_path, 'rb') as f:
+                    stored_key, data = pickle.load(f)
+                if stored_key == cache_key:
+                    _yaml_cache[file_path] = (cache_key, data)
+                    return data
+            except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+                pass  # Corrupt cache file; fall through to reparse
+
+        # JSON fast path: ORT can emit JSON directly (ort analyze -f JSON),
+        # and earlier runs leave a converted sidecar behind. Either way,
+        # a sibling .json at least as new as the YAML skips the YAML parse
+        # (3-10x faster even against libyaml).
+        json_path = f"{os.path.splitext(file_path)[0]}.json"
+        try:
+            if os.stat(json_path).st_mtime_ns >= st.st_mtime_ns:
+                with open(json_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                _yaml_cache[file_path] = (cache_key, data)
+                return data
+        except (OSError, ValueError):
+            pass  # No usable sidecar; fall through to the YAML parse
+
+        # Binary mode: libyaml accepts bytes directly and skips the
+        # Python-level decode pass.
+        with open(file_path, 'rb') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+
+        _yaml_cache[file_path] = (cache_key, data)
+        try:
+            with open(pickle_path, 'wb') as f:
+                pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(json_path, 'wb') as f:
+                f.write(_json_dumps(data))
+        except (OSError, TypeError):
+            pass  # Read-only location or unserializable node; caches are best effort
+        return data
+    
+    def extract_key_info(self, ort_data: dict[str, Any]) -> tuple[dict[str, Any], str]:
+        """Extract key information and the analysis status from ORT results.
+
+        Only the fields the prompt actually uses are kept: scalar metadata,
+        counts, the issues map, and the license/severity aggregates. The
+        full tree (which can hold hundreds of MB of package metadata) is
+        not retained. The status is determined in the same pass so the
+        nested dict is walked only once.
+
+        Returns a (key_info, status) tuple.
+        """
+        analyzer = ort_data.get('analyzer', {})
+        result = analyzer.get('result', {})
+        repository = ort_data.get('repository', {})
+
+        packages = result.get('packages', [])
+        projects = result.get('projects', [])
+        issues = result.get('issues', {})
+
+        # Aggregates carry the same analytical signal as raw per-package
+        # lines at a fraction of the prompt tokens.
+        license_counts = Counter(
+            ', '.join(pkg.get('declared_licenses') or ['Unknown'])
+            for pkg in packages
+        )
+        severity_counts = Counter(
+            issue.get('severity', 'Unknown')
+            for issue_list in issues.values()
+            for issue in issue_list
+        )
+
+        key_info = {
+            'repository_url': repository.get('vcs_processed', {}).get('url', 'N/A'),
+            'revision': repository.get('vcs_processed', {}).get('revision', 'N/A'),
+            'ort_version': analyzer.get('environment', {}).get('ort_version', 'N/A'),
+            'scan_time': {
+                'start': str(analyzer.get('start_time', 'N/A')),
+                'end': str(analyzer.get('end_time', 'N/A'))
+            },
+            'num_projects': len(projects),
+            'num_packages': len(packages),
+            'issues': issues,
+            'license_counts': dict(license_counts.most_common()),
+            'severity_counts': dict(severity_counts.most_common()),
+            'package_managers': analyzer.get('config', {}).get('enabled_package_managers', [])
+        }
+        return key_info, self.determine_analysis_status(key_info)
+
+    def load_key_info(self, file_path: str) -> tuple[dict[str, Any], str]:
+        """Load the key-info projection and status for an analyzer result.
+
+        The projection is a few KB regardless of input size, so it is
+        cached as a JSON sidecar carrying the source file's (mtime_ns,
+        size) key; on a hit the full YAML tree is never materialized.
+
+        Returns a (key_info, status) tuple.
+        """
+        st = os.stat(file_path)
+        cache_key = [st.st_mtime_ns, st.st_size]  # List: JSON round-trips it as-is
+        projection_path = f"{file_path}.keyinfo.json"
+        if os.path.exists(projection_path):
+            try:
+                with open(projection_path, 'r', encoding='utf-8') as f:
+                    sidecar = json.load(f)
+                if sidecar.get('key') == cache_key:
+                    key_info = sidecar['key_info']
+                    return key_info, self.determine_analysis_status(key_info)
+            except (json.JSONDecodeError, OSError, KeyError, AttributeError):
+                pass  # Corrupt sidecar; fall through to full parse
+
         ort_data = self.load_ort_results(file_path)
-        key_info = self.extract_key_info(ort_data)
-        status = self.determine_analysis_status(ort_data)
-        
+        _validate_ort(ort_data)  # Raises ValueError on schema breakage
+        key_info, status = self.extract_key_info(ort_data)
+        try:
+            with open(projection_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'key_info': key_info}, f, default=str)
+        except OSError:
+            pass  # Read-only location; projection is recomputed next run
+        return key_info, status
+
+    def determine_analysis_status(self, key_info: dict[str, Any]) -> str:
+        """Determine the analysis status from already-extracted key info."""
+        if key_info['issues']:
+            return "ERROR"
+        elif key_info['num_packages'] > 0:
+            return "SUCCESS"
+        else:
+            return "INCOMPLETE"
+    
+    def generate_curation_prompt(self, key_info: dict[str, Any], status: str) -> str:
+        """Generate a comprehensive prompt for the LLM.
+
+        Built as a list of parts joined once at the end; repeated str +=
+        in the package/issue loops can degenerate to quadratic copying.
+        """
+        parts = [_PROMPT_HEADER.format(
+            status=status,
+            repository_url=key_info['repository_url'],
+            revision=key_info['revision'],
+            ort_version=key_info['ort_version'],
+            scan_start=key_info['scan_time']['start'],
+            scan_end=key_info['scan_time']['end'],
+            num_projects=key_info['num_projects'],
+            num_packages=key_info['num_packages'],
+            num_issues=len(key_info['issues'])
+        )]
+
+        if status == "SUCCESS":
+            parts.append(_SUCCESS_TEMPLATE)
+            parts.append("\n| License | Count |\n| --- | --- |")
+            parts.extend([f"\n| {license_label} | {count} |"
+                          for license_label, count in key_info['license_counts'].items()])
+
+        else:  # ERROR case
+            parts.append(_ERROR_TEMPLATE)
+            parts.append("\nIssue severity summary: " + ", ".join(
+                f"{severity}: {count}"
+                for severity, count in key_info['severity_counts'].items()))
+            # Large runs repeat the same issue across projects; collapse to
+            # one row per unique (source, message prefix) with a xN count
+            unique: dict[tuple[str, str], list] = {}
+            for issue in itertools.chain.from_iterable(key_info['issues'].values()):
+                pair = (issue.get('source', 'Unknown'),
+                        issue.get('message', 'Unknown')[:200])
+                entry = unique.get(pair)
+                if entry is None:
+                    unique[pair] = [issue.get('severity', 'Unknown'), 1]
+                else:
+                    entry[1] += 1
+            severity_rank = {'ERROR': 0, 'WARNING': 1, 'HINT': 2}
+            top_issues = sorted(
+                unique.items(),
+                key=lambda kv: (severity_rank.get(kv[1][0], 3), -kv[1][1])
+            )[:20]  # Most severe and most frequent first
+            parts.extend(
+                f"\n- Severity: {severity}"
+                f"\n  Source: {source}"
+                f"\n  Message (x{count}): {message}..."
+                for (source, message), (severity, count) in top_issues
+            )
+
+        parts.append(_PROMPT_FOOTER)
+        return "".join(parts)
+    
+    async def generate_report(self, file_path: str, run_ts: str | None = None) -> str:
+        """Generate the curation report using Azure OpenAI."""
+        # Parse in a worker thread so the event loop stays free (lets the
+        # HTTP client warm up its connection and other reports proceed)
+        try:
+            key_info, status = await asyncio.to_thread(self.load_key_info, file_path)
+        except ValueError as exc:
+            # Schema breakage: report it locally instead of paying for an
+            # LLM call over a junk prompt
+            return self._invalid_input_report(file_path, exc, run_ts)
+
         # Create prompt
         prompt = self.generate_curation_prompt(key_info, status)
-        
-        # Call Azure OpenAI
-        response = self.client.chat.completions.create(
+
+        # Call Azure OpenAI (served from the response cache when possible)
+        report = await self._chat_completion(prompt)
+        return self.format_metadata(key_info, status, run_ts) + report
+
+    def _invalid_input_report(self, file_path: str, error: Exception,
+                              run_ts: str | None = None) -> str:
+        """Deterministic report for input that failed schema validation."""
+        header = self.METADATA_TEMPLATE.format(
+            generated=run_ts or datetime.now().isoformat(timespec='seconds'),
+            status="INVALID",
+            repository_url="N/A",
+            revision="N/A"
+        )
+        return header + f"""## Error Summary
+
+The analyzer result `{file_path}` failed schema validation before any
+analysis was attempted, so no LLM call was made.
+
+```
+{error}
+```
+
+Re-run `ort analyze` to regenerate the file, then request the report again.
+"""
+
+    def _response_cache_path(self, prompt: str) -> str:
+        """Map a prompt to its disk-cache location."""
+        digest = hashlib.blake2b(prompt.encode('utf-8')).hexdigest()
+        return os.path.join(self.RESPONSE_CACHE_DIR, f"{digest}.md")
+
+    def _store_response(self, cache_path: str, content: str):
+        """Write a finished response to the disk cache (best effort)."""
+        try:
+            os.makedirs(self.RESPONSE_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError:
+            pass  # Unwritable cache dir; the report is still returned
+
+    async def _chat_completion(self, prompt: str) -> str:
+        """Run the chat completion, caching responses on disk by prompt hash."""
+        cache_path = self._response_cache_path(prompt)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            pass  # Cache miss
+
+        response = await self.client.chat.completions.create(
             model=self.deployment_name,
             messages=[
-                {"role": "system", "content": "You are an expert software compliance analyst specializing in open-source license compliance and dependency analysis. You always produce well-formatted, valid markdown with proper heading hierarchy, blank lines, and consistent formatting."},
+                {"role": "system", "content": self.SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3,
-            max_tokens=4000
+            temperature=0,  # Deterministic output, required for caching
+            max_tokens=2000  # Typical reports fit well under this cap
         )
-        
-        report = response.choices[0].message.content
-        
-        # Add metadata header
-        metadata = f"""# ORT Analysis Curation Report
+        content = response.choices[0].message.content
+        self._store_response(cache_path, content)
+        return content
+
+    async def stream_report(self, file_path: str, output_path: str,
+                            run_ts: str | None = None):
+        """Generate a report, streaming LLM tokens straight to the output file.
+
+        Each delta is written as it arrives, so the response is never
+        buffered whole in memory and output is visible as soon as the
+        model starts generating. Cached responses are written directly.
+        """
+        try:
+            key_info, status = await asyncio.to_thread(self.load_key_info, file_path)
+        except ValueError as exc:
+            report = self._invalid_input_report(file_path, exc, run_ts)
+            await asyncio.to_thread(self.save_report, report, output_path)
+            return
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Status:** {status}  
-**Repository:** {key_info['repository_url']}  
-**Revision:** {key_info['revision'][:8]}...
+        prompt = self.generate_curation_prompt(key_info, status)
+        cache_path = self._response_cache_path(prompt)
 
----
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.format_metadata(key_info, status, run_ts))
+
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as cached:
+                    f.write(cached.read())
+                print(f"Report saved to: {output_path}")
+                return
+            except OSError:
+                pass  # Cache miss
+
+            stream = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0,
+                max_tokens=2000,
+                stream=True
+            )
+            deltas = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    f.write(delta)
+                    deltas.append(delta)
+
+        self._store_response(cache_path, "".join(deltas))
+        print(f"Report saved to: {output_path}")
 
-"""
-        return metadata + report
+    def format_metadata(self, key_info: dict[str, Any], status: str,
+                        run_ts: str | None = None) -> str:
+        """Build the metadata header prepended to every report.
+
+        Batch callers pass one run_ts for the whole run instead of
+        formatting the current time once per report.
+        """
+        return self.METADATA_TEMPLATE.format(
+            generated=run_ts or datetime.now().isoformat(timespec='seconds'),
+            status=status,
+            repository_url=key_info['repository_url'],
+            revision=key_info['revision'][:8]
+        )
+
+    async def generate_reports_batch(self, file_paths: list[str],
+                                     poll_interval: float = 60.0) -> dict[str, str]:
+        """Generate reports for many analyzer results via the Batch API.
+
+        Batch completions cost roughly half the real-time price and
+        complete within 24h, which fits nightly CI compliance runs.
+        Returns a mapping of input file path to finished report; items
+        that fail inside the batch are printed and omitted. Use
+        generate_report for interactive single-file runs.
+        """
+        run_ts = datetime.now().isoformat(timespec='seconds')  # One stamp per run
+        key_infos = {}
+        statuses = {}
+        lines = []
+        for path in file_paths:
+            key_info, status = await asyncio.to_thread(self.load_key_info, path)
+            key_infos[path] = key_info
+            statuses[path] = status
+            lines.append(json.dumps({
+                "custom_id": path,
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": self.deployment_name,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": self.generate_curation_prompt(key_info, status)}
+                    ],
+                    "temperature": 0,
+                    "max_tokens": 2000
+                }
+            }))
+
+        input_file = await self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h"
+        )
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+        output = await self.client.files.content(batch.output_file_id)
+        reports = {}
+        errors = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            path = result["custom_id"]
+            # Failed items carry an error (or a non-200 response) instead
+            # of a completion body; collect them rather than blowing up
+            # and discarding the completed reports.
+            response = result.get("response")
+            if result.get("error") or not response or response.get("status_code", 200) != 200:
+                errors[path] = result.get("error") or response
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            reports[path] = self.format_metadata(key_infos[path], statuses[path], run_ts) + content
+        for path, error in errors.items():
+            print(f"Batch item failed for {path}: {error}")
+        return reports
+
+    async def generate_many(self, paths: list[str], concurrency: int = 20) -> dict[str, str]:
+        """Generate reports for many analyzer results concurrently.
+
+        Requests share the async client under a bounded semaphore, so N
+        inputs cost roughly one round-trip of latency instead of N.
+        Transient failures (rate limits, timeouts, connection drops) are
+        retried with random exponential backoff; anything else fails that
+        path immediately. Failed paths are printed and omitted.
+        Returns a mapping of input path to the written report path.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        run_ts = datetime.now().isoformat(timespec='seconds')  # One stamp per run
+
+        async def _one(path: str) -> str:
+            output_path = f"{os.path.splitext(path)[0]}-curation-report.md"
+            async with sem:
+                for attempt in range(3):
+                    try:
+                        await self.stream_report(path, output_path, run_ts)
+                        break
+                    except (openai.RateLimitError, openai.APITimeoutError,
+                            openai.APIConnectionError):
+                        # Only transient errors are worth a retry; auth or
+                        # bad-request failures would just repeat three times
+                        if attempt == 2:
+                            raise
+                        await asyncio.sleep(min(60.0, random.uniform(1.0, 4.0 * 2 ** attempt)))
+            return output_path
+
+        # return_exceptions: one permanently failing path must not discard
+        # the reports the other tasks already wrote
+        results = await asyncio.gather(*(_one(p) for p in paths), return_exceptions=True)
+        reports = {}
+        for path, result in zip(paths, results):
+            if isinstance(result, BaseException):
+                print(f"Report failed for {path}: {result}")
+            else:
+                reports[path] = result
+        return reports
     
     def save_report(self, report: str, output_path: str):
         """Save the generated report to a file."""
@@ -288,7 +768,7 @@ CRITICAL FORMATTING RULES:
         print(f"Report saved to: {output_path}")
 
 
-if __name__ == "__main__":
+async def main():
     # Get Azure configuration from environment variables
     azure_config = {
         'endpoint': os.environ.get('AZURE_OPENAI_ENDPOINT', 'https://ltts-cariad-ddd-mvp-ai-foundry.cognitiveservices.azure.com'),
@@ -308,16 +788,22 @@ if __name__ == "__main__":
     
     # Generate report
     input_file = "ort-results/analyzer/analyzer-result.yml"
-    output_file = f"curation-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+    # time_ns keeps the filename unique without a strftime round-trip
+    output_file = f"curation-report-{time.time_ns()}.md"
     
     try:
-        report = generator.generate_report(input_file)
-        generator.save_report(report, output_file)
+        await generator.stream_report(input_file, output_file)
+        with open(output_file, 'r', encoding='utf-8') as f:
+            preview = f.read(1000)
         print("\nReport Preview:")
         print("=" * 80)
-        print(report[:1000] + "...\n")
+        print(preview + "...\n")
         print("=" * 80)
         print(f"\nSuccessfully generated: {output_file}")
     except Exception as e:
         print(f"Error generating report: {str(e)}")
-        exit(1)
\ No newline at end of file
+        exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file